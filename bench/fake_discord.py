@@ -0,0 +1,246 @@
+import random
+import asyncio
+from collections import Counter, defaultdict
+
+# ----------------------
+# Simulated REST Layer
+# ----------------------
+#
+# Discord calls never leave the process. Each call is charged a simulated
+# latency on a virtual clock and counted against a per-route rate-limit
+# bucket. discord.py sends the first request to a new bucket alone and
+# learns the limit from its headers, so sequential calls that run a bucket
+# out are held back before sending: they count as rate-limit waits. Only a
+# call that overlaps another in-flight call on the same bucket can outrun
+# what discord.py knows and get a 429. Either way the virtual clock jumps
+# to the bucket reset. Nothing actually sleeps, so runs stay fast while
+# `clock` still shows how long the same traffic would take against real
+# Discord.
+
+DEFAULT_BUCKETS = {
+    "PUT /guilds/{guild_id}/members/{user_id}/roles/{role_id}": (10, 10.0),
+    "DELETE /guilds/{guild_id}/members/{user_id}/roles/{role_id}": (10, 10.0),
+    "POST /channels/{channel_id}/messages": (5, 5.0),
+    "POST /guilds/{guild_id}/scheduled-events": (10, 10.0),
+    "GET /guilds/{guild_id}/scheduled-events/{event_id}": (50, 1.0),
+    "PATCH /guilds/{guild_id}/scheduled-events/{event_id}": (10, 10.0),
+    "DELETE /guilds/{guild_id}/scheduled-events/{event_id}": (10, 10.0),
+}
+
+
+class FakeRest:
+    def __init__(self, latency=0.05, buckets=None):
+        self.latency = latency
+        self.buckets = dict(DEFAULT_BUCKETS if buckets is None else buckets)
+        self.clock = 0.0
+        self.calls = Counter()
+        self.rate_limited = Counter()  # 429 responses from overlapping calls on one bucket
+        self.waits = Counter()  # calls held back on an exhausted bucket
+        self.rate_limit_wait = 0.0
+        self._windows = defaultdict(lambda: [0.0, 0])  # bucket key -> [reset_at, used]
+        self._in_flight = Counter()
+
+    def reset(self):
+        """Clear counters and the clock between runs."""
+        self.clock = 0.0
+        self.calls.clear()
+        self.rate_limited.clear()
+        self.waits.clear()
+        self.rate_limit_wait = 0.0
+        self._windows.clear()
+
+    async def request(self, route, major=None):
+        self.calls[route] += 1
+        limit, per = self.buckets.get(route, (50, 1.0))
+        key = (route, major)
+        window = self._windows[key]
+        if self.clock >= window[0]:
+            window[0] = self.clock + per
+            window[1] = 0
+        if window[1] >= limit:
+            if self._in_flight[key]:
+                self.rate_limited[route] += 1
+            else:
+                self.waits[route] += 1
+            self.rate_limit_wait += window[0] - self.clock
+            self.clock = window[0]
+            window[0] = self.clock + per
+            window[1] = 0
+        window[1] += 1
+        self.clock += self.latency
+        self._in_flight[key] += 1
+        try:
+            await asyncio.sleep(0)  # yield like a real network call would
+        finally:
+            self._in_flight[key] -= 1
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    @property
+    def total_rate_limited(self):
+        return sum(self.rate_limited.values())
+
+    @property
+    def total_waits(self):
+        return sum(self.waits.values())
+
+
+# ----------------------
+# Fake Guild Objects
+# ----------------------
+
+class FakeRole:
+    def __init__(self, role_id, name):
+        self.id = role_id
+        self.name = name
+
+    def __repr__(self):
+        return f"<FakeRole {self.name!r}>"
+
+
+class FakeTextChannel:
+    def __init__(self, rest, channel_id):
+        self.rest = rest
+        self.id = channel_id
+        self.sent = 0
+
+    async def send(self, content):
+        await self.rest.request("POST /channels/{channel_id}/messages", major=self.id)
+        self.sent += 1
+
+
+class FakeScheduledEvent:
+    def __init__(self, guild, event_id, name):
+        self.guild = guild
+        self.id = event_id
+        self.name = name
+
+    async def edit(self, **fields):
+        await self.guild.rest.request("PATCH /guilds/{guild_id}/scheduled-events/{event_id}", major=self.guild.id)
+        self.name = fields.get("name", self.name)
+
+    async def delete(self):
+        await self.guild.rest.request("DELETE /guilds/{guild_id}/scheduled-events/{event_id}", major=self.guild.id)
+        self.guild.scheduled_events.pop(self.id, None)
+
+
+class FakeMember:
+    def __init__(self, guild, member_id, roles):
+        self.guild = guild
+        self.id = member_id
+        self.display_name = f"member-{member_id}"
+        self.roles = roles
+
+    async def add_roles(self, *roles):
+        for role in roles:
+            await self.guild.rest.request("PUT /guilds/{guild_id}/members/{user_id}/roles/{role_id}", major=self.guild.id)
+            if role not in self.roles:
+                self.roles.append(role)
+
+    async def remove_roles(self, *roles):
+        for role in roles:
+            await self.guild.rest.request("DELETE /guilds/{guild_id}/members/{user_id}/roles/{role_id}", major=self.guild.id)
+            if role in self.roles:
+                self.roles.remove(role)
+
+
+class FakeGuild:
+    def __init__(self, rest, guild_id=1):
+        self.rest = rest
+        self.id = guild_id
+        self.roles = []
+        self.members = []
+        self.scheduled_events = {}
+        self._next_event_id = 1
+
+    def add_scheduled_event(self, event_id, name):
+        """Seed an event that already exists, without a REST call."""
+        event = FakeScheduledEvent(self, event_id, name)
+        self.scheduled_events[event_id] = event
+        self._next_event_id = max(self._next_event_id, event_id + 1)
+        return event
+
+    async def create_scheduled_event(self, name, **fields):
+        await self.rest.request("POST /guilds/{guild_id}/scheduled-events", major=self.id)
+        return self.add_scheduled_event(self._next_event_id, name)
+
+    async def fetch_scheduled_event(self, event_id):
+        await self.rest.request("GET /guilds/{guild_id}/scheduled-events/{event_id}", major=self.id)
+        return self.scheduled_events[int(event_id)]
+
+
+class FakeBot:
+    """Stands in for `commands.Bot` where the bot code reads guilds and channels."""
+
+    def __init__(self, guild):
+        self.rest = guild.rest
+        self.guilds = [guild]
+        self.channels = {}
+
+    def get_channel(self, channel_id):
+        chan = self.channels.get(channel_id)
+        if chan is None:
+            chan = self.channels[channel_id] = FakeTextChannel(self.rest, channel_id)
+        return chan
+
+
+# ----------------------
+# Guild Generator
+# ----------------------
+
+BASE_ROLES = [
+    "approved", "male", "female", "YES CG!!",
+    "1st year", "2nd year", "3rd year", "4th year", "5th+ year", "alumni",
+]
+
+
+def build_guild(rules, member_count=5000, filler_roles=200, stale_rate=0.05, seed=0, rest=None):
+    """Build a guild whose roles cover every role named in `rules`.
+
+    Members get a random year, gender and CG status. Most already hold the
+    grants the rules would give them; `stale_rate` of them hold a wrong grant
+    or miss a right one so a sweep has real add/remove work to do.
+    """
+    rng = random.Random(seed)
+    rest = rest or FakeRest()
+    guild = FakeGuild(rest)
+
+    names = list(BASE_ROLES)
+    for rule in rules:
+        for group in rule["any_requires"]:
+            names.extend(group)
+        names.append(rule["grants"])
+    names.extend(f"filler role {n}" for n in range(filler_roles))
+    seen = set()
+    for name in names:
+        if name not in seen:
+            seen.add(name)
+            guild.roles.append(FakeRole(len(guild.roles) + 1, name))
+    by_name = {role.name: role for role in guild.roles}
+    grant_names = [rule["grants"] for rule in rules]
+    years = ["1st year", "2nd year", "3rd year", "4th year", "5th+ year", "alumni"]
+
+    for member_id in range(1, member_count + 1):
+        held = set()
+        if rng.random() < 0.9:
+            held.add("approved")
+        held.add(rng.choice(["male", "female"]))
+        held.add(rng.choice(years))
+        if rng.random() < 0.6:
+            held.add("YES CG!!")
+        held.update(rng.sample([f"filler role {n}" for n in range(filler_roles)], k=min(3, filler_roles)))
+
+        # grant the rule roles the member is already entitled to, in rule order
+        for rule in rules:
+            if any(all(r in held for r in group) for group in rule["any_requires"]):
+                held.add(rule["grants"])
+
+        if rng.random() < stale_rate:
+            grant = rng.choice(grant_names)
+            held.symmetric_difference_update({grant})
+
+        guild.members.append(FakeMember(guild, member_id, [by_name[name] for name in held]))
+
+    return guild
@@ -0,0 +1,167 @@
+import time
+import random
+import types
+from collections import Counter
+from datetime import date, timedelta
+
+# ----------------------
+# Fake gspread Backend
+# ----------------------
+
+class FakeWorksheet:
+    def __init__(self, spreadsheet, title, rows):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.rows = rows
+        self.writes = []
+
+    def get_all_values(self):
+        self.spreadsheet._call("get_all_values")
+        return [list(row) for row in self.rows]  # gspread returns fresh lists every call
+
+    def update_cell(self, row, col, value):
+        self.spreadsheet._call("update_cell")
+        while len(self.rows) < row:
+            self.rows.append([])
+        cells = self.rows[row - 1]
+        if len(cells) < col:
+            cells.extend([""] * (col - len(cells)))
+        cells[col - 1] = str(value)
+        self.writes.append((row, col, value))
+
+
+class FakeSpreadsheet:
+    """Serves generated rows per tab and records every read and write.
+
+    `latency` is a real sleep per call, to model the Sheets round trip on the
+    thread that makes it.
+    """
+
+    def __init__(self, tabs, latency=0.0):
+        self.latency = latency
+        self.calls = Counter()
+        self.tabs = {title: FakeWorksheet(self, title, rows) for title, rows in tabs.items()}
+
+    def _call(self, name):
+        self.calls[name] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def worksheet(self, title):
+        self._call("worksheet")
+        return self.tabs[title]
+
+    @property
+    def writes(self):
+        return sum(len(ws.writes) for ws in self.tabs.values())
+
+
+class FakeCalendarService:
+    """Minimal `googleapiclient` calendar stand-in: events().insert(...).execute()."""
+
+    def __init__(self):
+        self.inserted = []
+
+    def events(self):
+        return self
+
+    def insert(self, calendarId, body):
+        self.inserted.append(body)
+        return types.SimpleNamespace(execute=lambda: {"htmlLink": "https://calendar.invalid/event"})
+
+
+def install_import_fakes(open_spreadsheet=None):
+    """Patch Google auth and client entry points before media_sheet/event_sheet are imported.
+
+    Both modules authorize and open their spreadsheet at import time; this
+    swaps those calls for in-memory stand-ins so no credentials or network
+    are needed. The benchmark replaces each module's `spreadsheet` with a
+    generated one afterwards.
+    """
+    import os
+    import gspread
+    import googleapiclient.discovery
+    from google.oauth2.service_account import Credentials
+
+    os.environ.setdefault("GOOGLE_CREDENTIALS_JSON", "{}")
+    Credentials.from_service_account_info = classmethod(lambda cls, info, scopes=None: object())
+    opener = open_spreadsheet or (lambda url: FakeSpreadsheet({}))
+    gspread.authorize = lambda creds: types.SimpleNamespace(open_by_url=opener)
+    googleapiclient.discovery.build = lambda *args, **kwargs: FakeCalendarService()
+
+
+# ----------------------
+# Row Generators
+# ----------------------
+
+def _fmt(day):
+    return day.strftime("%m/%d/%Y")
+
+
+def media_rows(count, pending_rate=0.05, seed=0, today=None):
+    """Rows shaped like the media live sheet (two header rows, columns A..Y)."""
+    rng = random.Random(seed)
+    today = today or date.today()
+    rows = [["header"] * 25, ["header"] * 25]
+    for n in range(count):
+        row = [""] * 25
+        row[0] = rng.choice(["yes", "yes", "no", ""])          # A etl approved
+        row[1] = f"Requester {n}"                               # B
+        row[3] = f"Event {n}"                                   # D
+        if rng.random() < 0.7:
+            row[8] = f"https://forms.invalid/{n}"               # I link
+        start = today + timedelta(days=rng.randint(-60, 30))
+        row[9] = _fmt(start)                                    # J
+        row[10] = _fmt(start + timedelta(days=rng.randint(0, 21)))  # K
+        row[11] = rng.choice(["TRUE", "FALSE"])                 # L
+        row[12] = rng.choice(["TRUE", "FALSE"])                 # M
+        row[17] = rng.choice(["TRUE", "FALSE"])                 # R
+        pending = rng.random() < pending_rate
+        row[23] = "" if pending else "SENT"                     # X
+        row[24] = "" if pending and row[0] == "yes" else "SENT" # Y
+        rows.append(row)
+    return rows
+
+
+def event_rows(count, teams, pending_rate=0.05, dated_rate=0.5, seed=0, today=None, first_event_id=10_000_000):
+    """Rows shaped like the event request sheet (one header row, columns A..AC).
+
+    `dated_rate` of the rows are one-time events with a date in the past,
+    within two weeks or further out, and half of those already carry a
+    Discord event ID in column AC. Pending approved rows with dates take the
+    calendar and scheduled-event path of check_second_sheet; seed the guild
+    with the IDs from `scheduled_event_ids` so updates and deletes find them.
+    """
+    rng = random.Random(seed)
+    today = today or date.today()
+    rows = [["header"] * 29]
+    for n in range(count):
+        row = [""] * 29
+        row[1] = f"Requester {n}"                               # B
+        row[2] = rng.choice(teams)                              # C
+        row[6] = f"Recurring {n}" if rng.random() < 0.5 else "" # G
+        row[11] = f"One time {n}"                               # L
+        if rng.random() < dated_rate:
+            offset = rng.choice([
+                rng.randint(-30, -1),                           # already over
+                rng.randint(1, 13),                             # within 2 weeks
+                rng.randint(20, 90),                            # too far out
+            ])
+            row[12] = _fmt(today + timedelta(days=offset))      # M
+            row[13] = "07:00:00 PM"                             # N
+            row[14] = "09:00:00 PM"                             # O
+            if rng.random() < 0.5:
+                row[28] = str(first_event_id + n)               # AC
+        approved = rng.random() < 0.8
+        for col in (23, 24, 25):                                # X..Z
+            row[col] = "approved" if approved else rng.choice(["approved", "pending"])
+        pending = rng.random() < pending_rate
+        row[26] = "" if pending else "SENT"                     # AA
+        row[27] = "" if pending else "SENT"                     # AB
+        rows.append(row)
+    return rows
+
+
+def scheduled_event_ids(rows):
+    """Discord event IDs (column AC) present in generated event rows."""
+    return [int(row[28]) for row in rows[1:] if len(row) > 28 and row[28]]
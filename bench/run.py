@@ -0,0 +1,302 @@
+"""Offline benchmarks for the bot's hot paths.
+
+Runs apply_role_rules, sweep_all_members, check_sheet, check_second_sheet
+and the /media-links route against an in-memory guild and spreadsheet, and
+reports wall time, API call counts and peak memory for each.
+
+Usage (from the repo root):
+
+    python -m bench.run
+    python -m bench.run --members 10000 --rows 5000 --json bench_output.json
+"""
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+import logging
+import tracemalloc
+from contextlib import redirect_stdout
+
+from bench.fake_sheets import (
+    FakeSpreadsheet, install_import_fakes, media_rows, event_rows, scheduled_event_ids,
+)
+from bench.fake_discord import FakeRest, FakeBot, build_guild
+
+install_import_fakes()
+
+import main  # noqa: E402
+import media_sheet  # noqa: E402
+import event_sheet  # noqa: E402
+
+
+# ----------------------
+# Measurement
+# ----------------------
+
+class Result:
+    def __init__(self, name):
+        self.name = name
+        self.wall = 0.0
+        self.peak_kb = None
+        self.rest = None
+        self.sheet = None
+        self.extra = {}
+
+    def as_dict(self):
+        data = {"name": self.name, "wall_s": round(self.wall, 4), "peak_kb": self.peak_kb}
+        if self.rest is not None:
+            data.update(
+                discord_calls=self.rest.total_calls,
+                discord_429s=self.rest.total_rate_limited,
+                rate_limit_waits=self.rest.total_waits,
+                simulated_api_s=round(self.rest.clock, 2),
+                rate_limit_wait_s=round(self.rest.rate_limit_wait, 2),
+                calls_by_route=dict(self.rest.calls),
+            )
+        if self.sheet is not None:
+            data.update(sheet_calls=dict(self.sheet.calls), sheet_writes=self.sheet.calls["update_cell"])
+        data.update(self.extra)
+        return data
+
+
+def measure(name, func, trace_memory, rest=None, sheet=None):
+    """Run `func` (sync, or returning a coroutine) and record time, calls and memory."""
+    if rest is not None:
+        rest.reset()
+    if sheet is not None:
+        sheet.calls.clear()
+    if trace_memory:
+        tracemalloc.start()
+    # the bot prints and logs progress at INFO; keep both out of the report
+    log_level = main.logger.level
+    main.logger.setLevel(logging.WARNING)
+    try:
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            start = time.perf_counter()
+            value = func()
+            if asyncio.iscoroutine(value):
+                value = asyncio.run(value)
+            wall = time.perf_counter() - start
+    finally:
+        main.logger.setLevel(log_level)
+    result = Result(name)
+    result.wall = wall
+    if trace_memory:
+        result.peak_kb = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+        tracemalloc.stop()
+    result.rest = rest
+    result.sheet = sheet
+    return result, value
+
+
+def snapshot(result):
+    """Freeze the counters of a result so later scenarios can't change them."""
+    data = result.as_dict()
+    result.rest = None
+    result.sheet = None
+    result.extra = {k: v for k, v in data.items() if k not in ("name", "wall_s", "peak_kb")}
+    return result
+
+
+# ----------------------
+# Scenarios
+# ----------------------
+
+def bench_apply_role_rules(args):
+    guild = build_guild(main.MERGED_ROLE_RULES, args.members, args.filler_roles, seed=args.seed, rest=FakeRest(args.api_latency))
+    main.bot = FakeBot(guild)
+
+    async def run():
+        timings = []
+        changed = 0
+        for member in guild.members:
+            start = time.perf_counter()
+            if await main.apply_role_rules(member):
+                changed += 1
+            timings.append(time.perf_counter() - start)
+        return timings, changed
+
+    result, (timings, changed) = measure("apply_role_rules", run, args.memory, rest=guild.rest)
+    timings.sort()
+    result.extra.update(
+        members=len(timings),
+        members_changed=changed,
+        per_member_mean_ms=round(1000 * sum(timings) / len(timings), 3),
+        per_member_p95_ms=round(1000 * timings[int(0.95 * (len(timings) - 1))], 3),
+        per_member_max_ms=round(1000 * timings[-1], 3),
+    )
+    return [snapshot(result)]
+
+
+def bench_sweep(args):
+    guild = build_guild(main.MERGED_ROLE_RULES, args.members, args.filler_roles, seed=args.seed, rest=FakeRest(args.api_latency))
+    main.bot = FakeBot(guild)
+    delay = main.SWEEP_DELAY
+    main.SWEEP_DELAY = 0
+    try:
+        result, _ = measure("sweep_all_members", main.sweep_all_members, args.memory, rest=guild.rest)
+    finally:
+        main.SWEEP_DELAY = delay
+
+    # What the same sweep costs in production, with the real per-member delay.
+    # The rate-limit waits were measured without that delay; spread over the
+    # real sweep the buckets refill in between, so they are left out.
+    api_time = guild.rest.clock - guild.rest.rate_limit_wait
+    result.extra.update(
+        members=len(guild.members),
+        projected_production_s=round(result.wall + api_time + delay * len(guild.members), 1),
+    )
+    return [snapshot(result)]
+
+
+def bench_check_sheet(args):
+    tabs = {
+        tab: media_rows(args.rows, args.pending_rate, seed=args.seed + n)
+        for n, tab in enumerate(media_sheet.SHEET_TABS)
+    }
+    sheet = media_sheet.spreadsheet = FakeSpreadsheet(tabs, latency=args.sheet_latency)
+    rest = FakeRest(args.api_latency)
+    tick = media_sheet.setup_media_sheet_task(FakeBot(build_guild([], 0, 0, rest=rest)), start=False)
+
+    results = []
+    for label in ("cold", "steady"):
+        result, _ = measure(f"check_sheet ({label})", tick, args.memory, rest=rest, sheet=sheet)
+        result.extra.update(rows=args.rows * len(tabs))
+        results.append(snapshot(result))
+    return results
+
+
+def bench_check_second_sheet(args):
+    tabs = {
+        tab: event_rows(
+            args.rows, list(event_sheet.CHANNEL_MAP), args.pending_rate, args.dated_rate,
+            seed=args.seed + n, first_event_id=10_000_000 * (n + 1),
+        )
+        for n, tab in enumerate(event_sheet.SECOND_SHEET_TABS)
+    }
+    sheet = event_sheet.spreadsheet = FakeSpreadsheet(tabs, latency=args.sheet_latency)
+    rest = FakeRest(args.api_latency)
+    guild = build_guild([], 0, 0, rest=rest)
+    for rows in tabs.values():
+        for event_id in scheduled_event_ids(rows):
+            guild.add_scheduled_event(event_id, f"event {event_id}")
+    calendar = event_sheet.calendar_service
+    tick = event_sheet.setup_event_sheet_task(FakeBot(guild), start=False)
+
+    results = []
+    for label in ("cold", "steady"):
+        inserted = len(calendar.inserted)
+        result, _ = measure(f"check_second_sheet ({label})", tick, args.memory, rest=rest, sheet=sheet)
+        result.extra.update(
+            rows=args.rows * len(tabs),
+            calendar_inserts=len(calendar.inserted) - inserted,
+            scheduled_events=len(guild.scheduled_events),
+        )
+        results.append(snapshot(result))
+    return results
+
+
+def bench_media_links(args):
+    tabs = {
+        tab: media_rows(args.rows, seed=args.seed + n)
+        for n, tab in enumerate(media_sheet.SHEET_TABS)
+    }
+    sheet = media_sheet.spreadsheet = FakeSpreadsheet(tabs, latency=args.sheet_latency)
+    client = main.app.test_client()
+
+    def run():
+        timings = []
+        size = 0
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            response = client.get("/media-links")
+            timings.append(time.perf_counter() - start)
+            size = len(response.data)
+        return timings, size
+
+    result, (timings, size) = measure("/media-links", run, args.memory, sheet=sheet)
+    timings.sort()
+    result.extra.update(
+        requests=len(timings),
+        rows=args.rows * len(tabs),
+        per_request_mean_ms=round(1000 * sum(timings) / len(timings), 2),
+        per_request_max_ms=round(1000 * timings[-1], 2),
+        response_bytes=size,
+    )
+    return [snapshot(result)]
+
+
+SCENARIOS = {
+    "apply_role_rules": bench_apply_role_rules,
+    "sweep": bench_sweep,
+    "check_sheet": bench_check_sheet,
+    "check_second_sheet": bench_check_second_sheet,
+    "media_links": bench_media_links,
+}
+
+
+# ----------------------
+# Report
+# ----------------------
+
+def print_report(results, out=sys.stdout):
+    header = f"{'benchmark':<30} {'wall s':>9} {'peak KB':>10} {'discord':>8} {'429s':>6} {'rl waits':>9} {'sheet r/w':>11}"
+    print(header, file=out)
+    print("-" * len(header), file=out)
+    for result in results:
+        data = result.as_dict()
+        peak = "-" if data["peak_kb"] is None else f"{data['peak_kb']:.1f}"
+        discord_calls = data.get("discord_calls", "-")
+        rate_limited = data.get("discord_429s", "-")
+        waits = data.get("rate_limit_waits", "-")
+        if "sheet_calls" in data:
+            reads = data["sheet_calls"].get("get_all_values", 0)
+            sheet_rw = f"{reads}/{data['sheet_writes']}"
+        else:
+            sheet_rw = "-"
+        print(f"{data['name']:<30} {data['wall_s']:>9.4f} {peak:>10} {discord_calls:>8} {rate_limited:>6} {waits:>9} {sheet_rw:>11}", file=out)
+    print(file=out)
+    for result in results:
+        data = result.as_dict()
+        details = {
+            k: v for k, v in data.items()
+            if k not in ("name", "wall_s", "peak_kb", "calls_by_route", "sheet_calls")
+        }
+        print(f"{data['name']}: " + ", ".join(f"{k}={v}" for k, v in details.items()), file=out)
+
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--members", type=int, default=5000, help="members in the synthetic guild")
+    ap.add_argument("--filler-roles", type=int, default=200, help="extra roles not used by any rule")
+    ap.add_argument("--rows", type=int, default=1000, help="generated rows per sheet tab")
+    ap.add_argument("--pending-rate", type=float, default=0.05, help="share of rows still needing a notification")
+    ap.add_argument("--dated-rate", type=float, default=0.5, help="share of event rows with a one-time date")
+    ap.add_argument("--repeat", type=int, default=20, help="/media-links requests to time")
+    ap.add_argument("--api-latency", type=float, default=0.05, help="simulated Discord latency per call (virtual seconds)")
+    ap.add_argument("--sheet-latency", type=float, default=0.0, help="real sleep per fake Sheets call (seconds)")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--no-memory", dest="memory", action="store_false", help="skip tracemalloc (faster, no peak KB)")
+    ap.add_argument("--only", action="append", choices=sorted(SCENARIOS), help="run only these scenarios")
+    ap.add_argument("--json", metavar="PATH", help="also write results as JSON")
+    return ap.parse_args(argv)
+
+
+def main_cli(argv=None):
+    args = parse_args(argv)
+    results = []
+    for name, scenario in SCENARIOS.items():
+        if args.only and name not in args.only:
+            continue
+        results.extend(scenario(args))
+
+    print_report(results)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump([r.as_dict() for r in results], f, indent=2)
+
+
+if __name__ == "__main__":
+    main_cli()
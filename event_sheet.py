@@ -9,7 +9,9 @@ from google.oauth2.service_account import Credentials
 from googleapiclient.discovery import build
 
 from discord.ext import tasks
-from discord.enums import ScheduledEventEntityType, ScheduledEventPrivacyLevel
+from discord.enums import EntityType, PrivacyLevel
+
+import metrics
 
 # ----------------------------
 # Google Sheets + Calendar Setup
@@ -69,6 +71,15 @@ def create_calendar_event(summary, start_dt, end_dt, calendar_id="epicsanluisobi
     result = calendar_service.events().insert(calendarId=calendar_id, body=event).execute()
     return result.get("htmlLink")
 
+def timed_update_cell(sheet, row, col, value):
+    with metrics.SHEET_WRITE_SECONDS.time(sheet="events"):
+        sheet.update_cell(row, col, value)
+
+def fetch_rows(tab_name):
+    with metrics.SHEET_FETCH_SECONDS.time(sheet="events", tab=tab_name, caller="poll"):
+        sheet = spreadsheet.worksheet(tab_name)
+        return sheet, sheet.get_all_values()
+
 async def create_discord_event(bot, guild, name, start_dt, end_dt, location="TBA", description=""):
     try:
         event = await guild.create_scheduled_event(
@@ -76,9 +87,9 @@ async def create_discord_event(bot, guild, name, start_dt, end_dt, location="TBA
             description=description,
             start_time=start_dt,
             end_time=end_dt,
-            entity_type=ScheduledEventEntityType.external,
+            entity_type=EntityType.external,
             location=location,
-            privacy_level=ScheduledEventPrivacyLevel.guild_only
+            privacy_level=PrivacyLevel.guild_only
         )
         print(f"✅ Discord event created: {name}")
         return event.id
@@ -111,17 +122,19 @@ async def delete_discord_event(bot, guild, event_id):
 # Main task
 # ----------------------------
 
-def setup_event_sheet_task(bot):
+def setup_event_sheet_task(bot, start=True):
     @tasks.loop(seconds=60)
+    @metrics.timed(metrics.POLL_TICK_SECONDS, task="check_second_sheet")
     async def check_second_sheet():
         tz = pytz.timezone("America/Los_Angeles")
         now = datetime.now(tz)
+        pending = 0
 
         for tab_name in SECOND_SHEET_TABS:
             try:
-                sheet = await asyncio.to_thread(spreadsheet.worksheet, tab_name)
-                all_rows = await asyncio.to_thread(sheet.get_all_values)
+                sheet, all_rows = await asyncio.to_thread(fetch_rows, tab_name)
             except Exception as e:
+                metrics.SHEET_FETCH_ERRORS.inc(sheet="events", tab=tab_name, caller="poll", reason="error")
                 print(f"[Error loading tab '{tab_name}']: {e}")
                 continue
 
@@ -146,25 +159,31 @@ def setup_event_sheet_task(bot):
 
                 # Notify ETLs of new requests
                 if requester and status_aa != "sent":
+                    pending += 1
                     chan = bot.get_channel(CHANNEL_Z_ID)
                     if chan:
                         await chan.send(f"📌 **{requester}** submitted an **event request** for **{team}** team. Please review!")
-                        await asyncio.to_thread(sheet.update_cell, i+1, STATUS_COL_AA, "SENT")
+                        await asyncio.to_thread(timed_update_cell, sheet, i+1, STATUS_COL_AA, "SENT")
 
                 # Notify team if approved by all ETLs
                 if josh == nikki == ellie == "approved" and status_ab != "sent":
+                    pending += 1
                     description = recurring_name or one_time_name or "a request"
                     if team in CHANNEL_MAP:
                         chan = bot.get_channel(CHANNEL_MAP[team])
                         if chan:
                             await chan.send(f"✅ Your event request for **{description}** has been approved by the ETLs!")
-                            await asyncio.to_thread(sheet.update_cell, i+1, STATUS_COL_AB, "SENT")
+                            await asyncio.to_thread(timed_update_cell, sheet, i+1, STATUS_COL_AB, "SENT")
 
                         # Parse dates for one-time events
                         if date_str and start_str and end_str:
                             start_dt = parse_datetime(date_str, start_str)
                             end_dt = parse_datetime(date_str, end_str)
                             if start_dt and end_dt:
+                                # sheet times are Pacific; make them aware so they compare with `now`
+                                start_dt = tz.localize(start_dt)
+                                end_dt = tz.localize(end_dt)
+
                                 # Google Calendar
                                 try:
                                     await asyncio.to_thread(create_calendar_event, description, start_dt, end_dt)
@@ -180,7 +199,7 @@ def setup_event_sheet_task(bot):
                                     # Check if event has passed
                                     if end_dt < now:
                                         await delete_discord_event(bot, guild, discord_event_id)
-                                        await asyncio.to_thread(sheet.update_cell, i+1, DISCORD_ID_COL, "")
+                                        await asyncio.to_thread(timed_update_cell, sheet, i+1, DISCORD_ID_COL, "")
                                     elif within_2_weeks:
                                         # Update event if still upcoming
                                         await update_discord_event(bot, guild, discord_event_id, description, start_dt, end_dt, description)
@@ -189,8 +208,12 @@ def setup_event_sheet_task(bot):
                                     if within_2_weeks:
                                         new_event_id = await create_discord_event(bot, guild, description, start_dt, end_dt, description=description)
                                         if new_event_id:
-                                            await asyncio.to_thread(sheet.update_cell, i+1, DISCORD_ID_COL, new_event_id)
+                                            await asyncio.to_thread(timed_update_cell, sheet, i+1, DISCORD_ID_COL, new_event_id)
                                     else:
                                         print(f"ℹ️ Event '{description}' is more than 2 weeks away; skipping Discord creation.")
 
-    check_second_sheet.start()
+        metrics.SHEET_PENDING_ROWS.set(pending, sheet="events")
+
+    if start:
+        check_second_sheet.start()
+    return check_second_sheet
@@ -0,0 +1,153 @@
+import sys
+import time
+import asyncio
+import threading
+import traceback
+from collections import Counter, deque
+
+from metrics import LOOP_LAG_SECONDS, SLOW_CALLBACKS
+
+# ----------------------
+# Event Loop Sampling Profiler
+# ----------------------
+#
+# A background thread samples the stack of the thread running the event loop
+# every `interval` seconds. A heartbeat coroutine on the loop records when it
+# last ran; if the sampler sees the heartbeat is older than `slow_threshold`,
+# the loop is stuck inside a single callback and the captured stack is the
+# code that is blocking it (and the gateway heartbeat with it).
+
+HEARTBEAT_INTERVAL = 0.05  # seconds between loop heartbeats
+MAX_SLOW_EVENTS = 20
+
+
+class LoopProfiler:
+    def __init__(self):
+        self.loop = None
+        self.interval = 0.01
+        self.slow_threshold = 0.25
+        self.samples = Counter()
+        self.total_samples = 0
+        self.idle_samples = 0
+        self.slow_events = deque(maxlen=MAX_SLOW_EVENTS)
+        self.started_at = None
+        self._loop_thread_id = None
+        self._last_beat = 0.0
+        self._stall_stack = None
+        self._stall_started = None
+        self._lock = threading.Lock()  # guards samples, counters and slow_events
+        self._stop = threading.Event()
+        self._thread = None
+        self._heartbeat_task = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, loop, interval=0.01, slow_threshold=0.25):
+        """Start sampling `loop`. Must be called from the loop's own thread."""
+        if self.running:
+            return False
+        self.loop = loop
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        with self._lock:
+            self.samples.clear()
+            self.total_samples = 0
+            self.idle_samples = 0
+            self.slow_events.clear()
+        self.started_at = time.monotonic()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stall_stack = None
+        self._stall_started = None
+        self._stop.clear()
+        self._heartbeat_task = loop.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._sample_loop, name="loop-profiler", daemon=True)
+        self._thread.start()
+        return True
+
+    def stop(self):
+        if not self.running:
+            return False
+        self._stop.set()
+        self._thread.join(timeout=2)
+        self._thread = None
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+        return True
+
+    async def _heartbeat(self):
+        while True:
+            expected = time.monotonic() + HEARTBEAT_INTERVAL
+            self._last_beat = time.monotonic()
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            LOOP_LAG_SECONDS.observe(max(0.0, time.monotonic() - expected))
+
+    def _sample_loop(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            if frame.f_code.co_filename.endswith("selectors.py"):
+                stack = None  # loop is waiting on I/O
+            else:
+                stack = self._format_stack(frame)
+            with self._lock:
+                self.total_samples += 1
+                if stack is None:
+                    self.idle_samples += 1
+                else:
+                    self.samples[stack] += 1
+                self._check_stall(stack)
+
+    def _check_stall(self, stack):
+        now = time.monotonic()
+        stalled_for = now - self._last_beat - HEARTBEAT_INTERVAL
+        if stalled_for >= self.slow_threshold:
+            if self._stall_started is None and stack is not None:
+                self._stall_started = self._last_beat
+                self._stall_stack = stack
+        elif self._stall_started is not None:
+            duration = now - self._stall_started - HEARTBEAT_INTERVAL
+            SLOW_CALLBACKS.inc()
+            self.slow_events.append((duration, self._stall_stack))
+            self._stall_started = None
+            self._stall_stack = None
+
+    @staticmethod
+    def _format_stack(frame, limit=8):
+        entries = traceback.extract_stack(frame, limit=limit)
+        return " <- ".join(
+            f"{entry.name} ({entry.filename.rsplit('/', 1)[-1]}:{entry.lineno})"
+            for entry in reversed(entries)
+        )
+
+    def report(self, top=10):
+        # the sampler thread keeps writing while this runs on the loop thread
+        with self._lock:
+            samples = self.samples.copy()
+            total = self.total_samples
+            idle = self.idle_samples
+            slow_events = list(self.slow_events)
+
+        lines = []
+        elapsed = time.monotonic() - self.started_at if self.started_at else 0
+        lines.append(f"Sampled {total} stacks over {elapsed:.1f}s "
+                     f"(interval {self.interval * 1000:.0f}ms, slow threshold {self.slow_threshold * 1000:.0f}ms)")
+        if total:
+            lines.append(f"Idle: {100 * idle / total:.1f}%")
+        lines.append("")
+        lines.append("Top stacks:")
+        for stack, count in samples.most_common(top):
+            pct = 100 * count / total if total else 0
+            lines.append(f"{pct:5.1f}% {stack}")
+        lines.append("")
+        lines.append(f"Slow callbacks ({len(slow_events)}):")
+        for duration, stack in slow_events:
+            lines.append(f"{duration * 1000:7.0f}ms {stack}")
+        return "\n".join(lines)
+
+
+profiler = LoopProfiler()
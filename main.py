@@ -17,6 +17,8 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 from media_sheet import setup_media_sheet_task
 from event_sheet import setup_event_sheet_task
+import metrics
+from loop_profiler import profiler
 
 # ----------------------
 # Configuration
@@ -66,6 +68,7 @@ MERGED_ROLE_RULES = [
 
 LOG_CHANNEL_ID = 1388219823384690838  # Replace with your log channel ID
 UPDATE_COOLDOWN = 3  # seconds
+SWEEP_DELAY = 2  # seconds between members during a sweep
 recent_updates = defaultdict(float)
 sweeping = False
 
@@ -78,6 +81,16 @@ intents.members = True
 intents.message_content = True
 
 bot = commands.Bot(command_prefix="!", intents=intents)
+metrics.instrument_discord_http(bot)
+
+def pending_task_count():
+    # Called from the Flask thread; before login bot.loop is a placeholder, not a loop.
+    loop = bot.loop
+    if not isinstance(loop, asyncio.AbstractEventLoop) or loop.is_closed():
+        return 0
+    return len(asyncio.all_tasks(loop))
+
+metrics.EVENT_LOOP_TASKS.set_function(pending_task_count)
 
 # for web service
 # ----------------------
@@ -90,16 +103,19 @@ app = Flask('')
 def home():
     return "✅ Bot is running!"
 
+@app.route("/metrics")
+def metrics_endpoint():
+    return Response(metrics.render_prometheus(), mimetype="text/plain; version=0.0.4")
+
 def run_flask():
     app.run(host='0.0.0.0', port=8080)
 
-Thread(target=run_flask).start()
-
 # ----------------------
 # Flask App for google sites links
 # ----------------------
 
 @app.route("/media-links")
+@metrics.timed(metrics.MEDIA_LINKS_SECONDS)
 def media_links():
     from media_sheet import spreadsheet, SHEET_TABS
     now = datetime.now(pytz.timezone("America/Los_Angeles"))
@@ -156,10 +172,12 @@ def media_links():
     for tab_name in SHEET_TABS:
         logger.info(f"➡️ Loading tab '{tab_name}'")
         try:
-            ws = spreadsheet.worksheet(tab_name)
-            rows = ws.get_all_values()
+            with metrics.SHEET_FETCH_SECONDS.time(sheet="media", tab=tab_name, caller="media-links"):
+                ws = spreadsheet.worksheet(tab_name)
+                rows = ws.get_all_values()
             logger.info(f"   ✅ Loaded {len(rows)} rows")
         except Exception as e:
+            metrics.SHEET_FETCH_ERRORS.inc(sheet="media", tab=tab_name, caller="media-links", reason="error")
             logger.error(f"   ❌ Failed to load tab {tab_name}: {e}")
             continue
 
@@ -191,6 +209,7 @@ def media_links():
                 html += f"<li><a href='{link}' target='_blank'>{display_name}</a></li>"
                 active_count += 1
 
+    metrics.MEDIA_LINKS_ACTIVE.set(active_count)
     if active_count == 0:
         html += "<div class='no-links'>No active links at the moment. Check back soon!</div>"
 
@@ -215,6 +234,7 @@ async def log_message(message):
 # Role Logic
 # ----------------------
 
+@metrics.timed(metrics.ROLE_RULES_SECONDS)
 async def apply_role_rules(member):
     guild = member.guild
     member_roles = [r.name for r in member.roles]
@@ -234,15 +254,19 @@ async def apply_role_rules(member):
             try:
                 await member.add_roles(grant_role)
                 await log_message(f"➕ Gave **{grant_role.name}** to **{member.display_name}**")
+                metrics.ROLE_CHANGES.inc(action="add", role=grant_name)
                 changed = True
             except Exception as e:
+                metrics.ROLE_ERRORS.inc(action="add", role=grant_name)
                 await log_message(f"❌ Could not add {grant_role.name} to {member.display_name}: {e}")
         elif not eligible and has_grant:
             try:
                 await member.remove_roles(grant_role)
                 await log_message(f"➖ Removed **{grant_role.name}** from **{member.display_name}**")
+                metrics.ROLE_CHANGES.inc(action="remove", role=grant_name)
                 changed = True
             except Exception as e:
+                metrics.ROLE_ERRORS.inc(action="remove", role=grant_name)
                 await log_message(f"❌ Could not remove {grant_role.name} from {member.display_name}: {e}")
 
     return changed
@@ -291,6 +315,7 @@ async def on_member_update(before, after):
 
     now = time.time()
     if now - recent_updates[after.id] < UPDATE_COOLDOWN:
+        metrics.COOLDOWN_HITS.inc()
         return
     recent_updates[after.id] = now
 
@@ -349,6 +374,40 @@ async def migrate_roles(ctx):
     await ctx.send(f"✅ Migrated {updated} members to {target_role.name}.")
     await log_message(f"✅ Batch role migration completed. {updated} members updated.")
 
+@bot.command()
+@commands.has_permissions(administrator=True)
+async def profile_loop(ctx, action: str = "status", slow_ms: int = 250):
+    """!profile_loop start [slow_ms] | stop | status"""
+    action = action.lower()
+    usage = "❌ Usage: `!profile_loop start [slow_ms]`, `!profile_loop stop` or `!profile_loop status`"
+    if action == "start":
+        if slow_ms <= 0:
+            await ctx.send(usage)
+            return
+        if profiler.start(asyncio.get_running_loop(), slow_threshold=slow_ms / 1000):
+            await ctx.send(f"🩺 Event loop profiling started (slow callback threshold {slow_ms}ms).")
+            await log_message(f"🩺 {ctx.author.display_name} started event loop profiling.")
+        else:
+            await ctx.send("⚠️ Profiling is already running.")
+        return
+
+    if action == "stop":
+        if not profiler.stop():
+            await ctx.send("⚠️ Profiling is not running.")
+            return
+        await log_message(f"🩺 {ctx.author.display_name} stopped event loop profiling.")
+    elif action != "status":
+        await ctx.send(usage)
+        return
+    elif profiler.started_at is None:
+        await ctx.send("ℹ️ Profiling has not been run yet.")
+        return
+
+    report = profiler.report()
+    if len(report) > 1900:
+        report = report[:1900] + "\n..."
+    await ctx.send(f"```\n{report}\n```")
+
 # ----------------------
 # Sweep Function (with delay)
 # ----------------------
@@ -357,6 +416,7 @@ async def sweep_all_members():
     global sweeping
     sweeping = True
     changed_count = 0
+    start = pytime.perf_counter()
 
     try:
         if not bot.guilds:
@@ -367,14 +427,17 @@ async def sweep_all_members():
         members = guild.members
         await log_message(f"🔍 Sweeping {len(members)} members...")
 
-        for member in members:
+        for idx, member in enumerate(members):
+            metrics.SWEEP_QUEUE_DEPTH.set(len(members) - idx)
             changed = await apply_role_rules(member)
             if changed:
                 changed_count += 1
-            await asyncio.sleep(2)  # delay to prevent rate limits
+            await asyncio.sleep(SWEEP_DELAY)  # delay to prevent rate limits
 
     finally:
         sweeping = False
+        metrics.SWEEP_QUEUE_DEPTH.set(0)
+        metrics.SWEEP_SECONDS.observe(pytime.perf_counter() - start)
         await log_message(f"✅ Sweep completed. {changed_count} members had roles changed.")
 
 
@@ -382,4 +445,6 @@ async def sweep_all_members():
 # Run the Bot
 # ----------------------
 
-bot.run(os.environ['BOT_TOKEN'])
+if __name__ == "__main__":
+    Thread(target=run_flask).start()
+    bot.run(os.environ['BOT_TOKEN'])
@@ -4,6 +4,8 @@ from google.oauth2.service_account import Credentials
 from discord.ext import tasks
 from functools import partial
 
+import metrics
+
 SERVICE_ACCOUNT_INFO = json.loads(os.environ["GOOGLE_CREDENTIALS_JSON"])
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 creds = Credentials.from_service_account_info(SERVICE_ACCOUNT_INFO, scopes=SCOPES)
@@ -23,16 +25,20 @@ sent_to_team = 25
 spreadsheet = gc.open_by_url(SHEET_URL)
 
 def blocking_fetch_rows(sheet, tab_name):
-    ws = sheet.worksheet(tab_name)
-    return ws, ws.get_all_values()
+    with metrics.SHEET_FETCH_SECONDS.time(sheet="media", tab=tab_name, caller="poll"):
+        ws = sheet.worksheet(tab_name)
+        return ws, ws.get_all_values()
 
 def blocking_update_cell(ws, row, col, value):
-    ws.update_cell(row, col, value)
+    with metrics.SHEET_WRITE_SECONDS.time(sheet="media"):
+        ws.update_cell(row, col, value)
 
-def setup_media_sheet_task(bot):
+def setup_media_sheet_task(bot, start=True):
     @tasks.loop(seconds=60)
+    @metrics.timed(metrics.POLL_TICK_SECONDS, task="check_sheet")
     async def check_sheet():
         loop = asyncio.get_running_loop()
+        pending = 0
         for tab_name in SHEET_TABS:
             try:
                 ws, all_rows = await asyncio.wait_for(
@@ -40,9 +46,11 @@ def setup_media_sheet_task(bot):
                     timeout=15
                 )
             except asyncio.TimeoutError:
+                metrics.SHEET_FETCH_ERRORS.inc(sheet="media", tab=tab_name, caller="poll", reason="timeout")
                 print(f"🛑 Timeout loading '{tab_name}' tab")
                 continue
             except Exception as e:
+                metrics.SHEET_FETCH_ERRORS.inc(sheet="media", tab=tab_name, caller="poll", reason="error")
                 print(f"[Error in sheet '{tab_name}']: {e}")
                 continue
 
@@ -63,6 +71,7 @@ def setup_media_sheet_task(bot):
                 status_y = row[sent_to_team - 1].strip().lower()    # Column Y, mark lg/slide team
 
                 if b and d and status_x != "sent":
+                    pending += 1
                     chan = bot.get_channel(CHANNEL_Z_ID)
                     if chan:
                         await chan.send(f"📢 **{b}** has added {d} to the **media live sheet**. Waiting to be reviewed!")
@@ -70,6 +79,7 @@ def setup_media_sheet_task(bot):
                     continue
 
                 if a == "yes" and status_y != "sent":
+                    pending += 1
                     sent = False
                     if l == "true" and m == "true":
                         chan = bot.get_channel(CHANNEL_X_ID)
@@ -95,4 +105,8 @@ def setup_media_sheet_task(bot):
                     if sent:
                         await loop.run_in_executor(None, partial(blocking_update_cell, ws, i+1, sent_to_team, "SENT"))
 
-    check_sheet.start()
+        metrics.SHEET_PENDING_ROWS.set(pending, sheet="media")
+
+    if start:
+        check_sheet.start()
+    return check_sheet
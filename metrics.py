@@ -0,0 +1,298 @@
+import time
+import inspect
+import logging
+import threading
+import functools
+from contextlib import contextmanager
+
+# ----------------------
+# Metric Types
+# ----------------------
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_lock = threading.Lock()
+_registry = {}
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+class Counter:
+    kind = "counter"
+
+    def __init__(self, name, help_text):
+        self.name = name
+        self.help = help_text
+        self._values = {}
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self):
+        for key, value in self._values.items():
+            yield self.name, key, (), value
+
+
+class Gauge:
+    kind = "gauge"
+
+    def __init__(self, name, help_text, func=None):
+        self.name = name
+        self.help = help_text
+        self._values = {}
+        self._func = func  # optional callback evaluated at scrape time
+
+    def set_function(self, func):
+        self._func = func
+
+    def set(self, value, **labels):
+        with _lock:
+            self._values[_label_key(labels)] = value
+
+    def inc(self, amount=1, **labels):
+        key = _label_key(labels)
+        with _lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount=1, **labels):
+        self.inc(-amount, **labels)
+
+    def samples(self):
+        if self._func is not None:
+            try:
+                yield self.name, (), (), self._func()
+            except Exception:
+                pass
+        for key, value in self._values.items():
+            yield self.name, key, (), value
+
+
+class Histogram:
+    kind = "histogram"
+
+    def __init__(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.buckets = tuple(sorted(buckets)) + (float("inf"),)
+        self._values = {}  # label key -> [bucket counts, sum, count]
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        with _lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            for idx, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[0][idx] += 1
+            state[1] += value
+            state[2] += 1
+
+    def samples(self):
+        for key, (counts, total, count) in self._values.items():
+            for bound, bucket_count in zip(self.buckets, counts):
+                yield self.name + "_bucket", key, (("le", _format_value(bound)),), bucket_count
+            yield self.name + "_sum", key, (), total
+            yield self.name + "_count", key, (), count
+
+    @contextmanager
+    def time(self, **labels):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+
+def _register(metric):
+    with _lock:
+        existing = _registry.get(metric.name)
+        if existing is not None:
+            return existing
+        _registry[metric.name] = metric
+        return metric
+
+
+def counter(name, help_text):
+    return _register(Counter(name, help_text))
+
+
+def gauge(name, help_text, func=None):
+    return _register(Gauge(name, help_text, func))
+
+
+def histogram(name, help_text, buckets=DEFAULT_BUCKETS):
+    return _register(Histogram(name, help_text, buckets))
+
+
+def timed(hist, **labels):
+    """Decorator that records the runtime of a sync or async function in `hist`."""
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with hist.time(**labels):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with hist.time(**labels):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def render_prometheus():
+    """Render every registered metric in the Prometheus text exposition format."""
+    lines = []
+    with _lock:
+        metrics = list(_registry.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, key, extra, value in list(metric.samples()):
+                lines.append(f"{name}{_format_labels(key, extra)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# ----------------------
+# Bot Metrics
+# ----------------------
+
+ROLE_RULES_SECONDS = histogram("bot_apply_role_rules_seconds", "Time spent in apply_role_rules per member.")
+ROLE_CHANGES = counter("bot_role_changes_total", "Roles added or removed by the role rules.")
+ROLE_ERRORS = counter("bot_role_change_errors_total", "Failed role add/remove attempts.")
+SWEEP_SECONDS = histogram(
+    "bot_sweep_seconds", "Duration of a full member sweep.",
+    buckets=(1, 5, 15, 30, 60, 120, 300, 600, 1200, 1800, 3600, 7200),
+)
+SWEEP_QUEUE_DEPTH = gauge("bot_sweep_queue_depth", "Members still waiting to be processed by the running sweep.")
+COOLDOWN_HITS = counter("bot_update_cooldown_hits_total", "Member updates skipped by the local UPDATE_COOLDOWN rate limit.")
+
+SHEET_FETCH_SECONDS = histogram("bot_sheet_fetch_seconds", "Time to fetch all rows of a worksheet tab.")
+SHEET_FETCH_ERRORS = counter("bot_sheet_fetch_errors_total", "Worksheet fetches that failed or timed out.")
+SHEET_WRITE_SECONDS = histogram("bot_sheet_update_cell_seconds", "Time spent in gspread update_cell writes.")
+SHEET_PENDING_ROWS = gauge("bot_sheet_pending_rows", "Rows found needing a notification on the last poll tick.")
+POLL_TICK_SECONDS = histogram("bot_poll_tick_seconds", "Duration of one sheet polling loop iteration.")
+
+DISCORD_REQUEST_SECONDS = histogram(
+    "bot_discord_request_seconds",
+    "Latency of Discord REST calls, including any time discord.py spent waiting on rate limits and retrying.",
+)
+DISCORD_REQUEST_ERRORS = counter("bot_discord_request_errors_total", "Discord REST calls that raised an error.")
+DISCORD_RATE_LIMITS = counter(
+    "bot_discord_rate_limits_total",
+    "Discord rate-limit events: 429 responses, global limits, and requests discord.py held back on an exhausted bucket.",
+)
+DISCORD_RATE_LIMIT_WAIT_SECONDS = histogram(
+    "bot_discord_rate_limit_wait_seconds",
+    "Time a Discord REST call waited for an exhausted rate-limit bucket before being sent.",
+)
+
+MEDIA_LINKS_SECONDS = histogram("bot_media_links_render_seconds", "Time to render the /media-links page.")
+MEDIA_LINKS_ACTIVE = gauge("bot_media_links_active", "Active links shown on the last /media-links render.")
+
+LOOP_LAG_SECONDS = histogram(
+    "bot_event_loop_lag_seconds", "Event loop scheduling lag measured while profiling is on.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+SLOW_CALLBACKS = counter("bot_slow_callbacks_total", "Event loop stalls longer than the slow-callback threshold.")
+EVENT_LOOP_TASKS = gauge("bot_event_loop_tasks", "Pending asyncio tasks on the bot event loop.")
+
+
+# ----------------------
+# discord.py Hooks
+# ----------------------
+
+# discord.py's 429 and global rate-limit warnings, matched on the format string
+_RATE_LIMIT_FORMATS = (
+    ("responded with 429", "429"),
+    ("Global rate limit has been hit", "global"),
+)
+
+
+class _RateLimitLogFilter(logging.Filter):
+    """Counts the rate-limit warnings discord.py logs on the `discord.http` logger."""
+
+    def filter(self, record):
+        if record.levelno < logging.WARNING or not isinstance(record.msg, str):
+            return True
+        for fragment, kind in _RATE_LIMIT_FORMATS:
+            if fragment in record.msg:
+                DISCORD_RATE_LIMITS.inc(kind=kind)
+                break
+        return True
+
+
+def _instrument_ratelimit_waits():
+    """Wrap discord.py's Ratelimit.acquire to count and time waits on exhausted buckets."""
+    from discord.http import Ratelimit
+
+    if getattr(Ratelimit.acquire, "_metrics_wrapped", False):
+        return
+    original_acquire = Ratelimit.acquire
+
+    @functools.wraps(original_acquire)
+    async def acquire(self):
+        if self.remaining > 0 or (self.expires is not None and self.is_expired()):
+            return await original_acquire(self)
+        DISCORD_RATE_LIMITS.inc(kind="bucket")
+        start = time.perf_counter()
+        try:
+            return await original_acquire(self)
+        finally:
+            DISCORD_RATE_LIMIT_WAIT_SECONDS.observe(time.perf_counter() - start)
+
+    acquire._metrics_wrapped = True
+    Ratelimit.acquire = acquire
+
+
+def instrument_discord_http(bot):
+    """Wrap bot.http.request so every Discord REST call is timed and counted."""
+    http = bot.http
+    if getattr(http, "_metrics_wrapped", False):
+        return
+    original_request = http.request
+
+    @functools.wraps(original_request)
+    async def request(route, **kwargs):
+        labels = {"method": getattr(route, "method", "?"), "route": getattr(route, "path", "?")}
+        start = time.perf_counter()
+        try:
+            return await original_request(route, **kwargs)
+        except Exception as e:
+            status = getattr(e, "status", None)
+            DISCORD_REQUEST_ERRORS.inc(status=status if status is not None else type(e).__name__, **labels)
+            raise
+        finally:
+            DISCORD_REQUEST_SECONDS.observe(time.perf_counter() - start, **labels)
+
+    http.request = request
+    http._metrics_wrapped = True
+    _instrument_ratelimit_waits()
+
+    http_logger = logging.getLogger("discord.http")
+    if not any(isinstance(f, _RateLimitLogFilter) for f in http_logger.filters):
+        http_logger.addFilter(_RateLimitLogFilter())